@@ -1,4 +1,15 @@
-from fibsem_tools._version import version
+try:
+    # written by hatch-vcs at build time, so no package metadata lookup is needed
+    from fibsem_tools._version import version
+except ImportError:  # no cov
+    # running from a source tree that was never built
+    from importlib.metadata import PackageNotFoundError
+    from importlib.metadata import version as _version
+
+    try:
+        version = _version("fibsem-tools")
+    except PackageNotFoundError:
+        version = "0+unknown"
 
 __version__ = version
 
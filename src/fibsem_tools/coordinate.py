@@ -7,7 +7,7 @@ from cellmap_schemas.multiscale.cosem import STTransform
 from xarray import DataArray
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
     from typing import Any, Literal
 
     from fibsem_tools.type import ArrayLike
@@ -58,6 +58,27 @@ def flip(data: DataArray, dims: Sequence[str] = []) -> DataArray:
     return data.copy(data=data[flip_selector].data)
 
 
+def _check_coord_length(coord: DataArray) -> None:
+    """
+    Check that a coordinate has enough elements to define a scaling transformation.
+    """
+    if coord.size < 2:
+        msg = (
+            f"The coordinate with dims = {coord.dims} does not have enough elements to calculate "
+            "a scaling transformation. A minimum of 2 elements are needed."
+        )
+        raise ValueError(msg)
+
+
+def _check_scale(scale: Sequence[Any]) -> None:
+    """
+    Check that every element of a (possibly nested) sequence of scales is positive.
+    """
+    if not (np.array(scale) > 0).all():
+        msg = f"Invalid scale: {scale}. Scale must be greater than 0."
+        raise ValueError(msg)
+
+
 def stt_from_coords(
     coords: Sequence[DataArray], order: Literal["C", "F"] = "C"
 ) -> STTransform:
@@ -84,20 +105,17 @@ def stt_from_coords(
     translate = []
 
     for c in coords:
-        if len(c) < 2:
-            msg = (
-                f"The coordinate with dims = {c.dims} does not have enough elements to calculate "
-                "a scaling transformation. A minimum of 2 elements are needed."
-            )
-            raise ValueError(msg)
+        _check_coord_length(c)
+        # read the backing numpy array once, instead of indexing the DataArray per element
+        values = np.asarray(c.values)
         axes.append(str(c.dims[0]))
         # default unit is m
         units.append(c.attrs.get("units", "m"))
-        translate.append(float(c[0]))
-        scale.append(abs(float(c[1]) - float(c[0])))
-        if any(tuple(s <= 0 for s in scale)):
-            msg = f"Invalid scale: {scale}. Scale must be greater than 0."
-            raise ValueError(msg)
+        first, second = values[:2].astype("float64").tolist()
+        translate.append(first)
+        scale.append(abs(second - first))
+
+    _check_scale(scale)
 
     return STTransform(
         axes=tuple(axes),
@@ -141,6 +159,82 @@ def stt_from_array(array: DataArray, *, reverse_axes: bool = False) -> STTransfo
     return stt_from_coords(tuple(array.coords.values())[orderer], output_order)
 
 
+def stt_from_arrays(
+    arrays: Iterable[DataArray], *, reverse_axes: bool = False
+) -> tuple[STTransform, ...]:
+    """
+    Generate a spatial transform for each element of a collection of DataArrays, e.g.
+    the levels of a multiscale pyramid. This produces the same result as calling
+    `stt_from_array` on each array, but the coordinates of all the arrays are gathered in
+    a single pass and the scales and translations are computed with one numpy operation.
+
+    Parameters
+    ----------
+
+    arrays: Iterable[xarray.DataArray]
+        DataArrays with coordinates that can be expressed as scaling + translation
+        applied to a regular grid. All arrays must have the same dimensions.
+    reverse_axes: boolean, default=False
+        If `True`, the order of the `axes` in each spatial transform will
+        be reversed relative to the order of the dimensions of the arrays, and the
+        `order` field of each resulting STTransform will be set to "F". This is
+        designed for compatibility with N5 tools.
+
+    Returns
+    -------
+
+    tuple[STTransform, ...]
+        One STTransform per array, each consistent with the coordinates defined on
+        that array.
+    """
+
+    orderer = slice(None)
+    output_order: Literal["C", "F"] = "C"
+    if reverse_axes:
+        orderer = slice(-1, None, -1)
+        output_order = "F"
+
+    coords = tuple(tuple(array.coords.values())[orderer] for array in arrays)
+    if len(coords) == 0:
+        return ()
+
+    axes = tuple(str(c.dims[0]) for c in coords[0])
+    units: list[tuple[str, ...]] = []
+    bounds = []
+
+    for array_coords in coords:
+        array_axes = tuple(str(c.dims[0]) for c in array_coords)
+        if array_axes != axes:
+            msg = f"All arrays must have the same dimensions. Got {array_axes} and {axes}."
+            raise ValueError(msg)
+        for c in array_coords:
+            _check_coord_length(c)
+        # default unit is m
+        units.append(tuple(c.attrs.get("units", "m") for c in array_coords))
+        bounds.append([c.values[:2] for c in array_coords])
+
+    # the first two coordinate values of each axis of each array, indexed by
+    # (array, axis, element)
+    bounds_array = np.array(bounds, dtype="float64").reshape(len(coords), len(axes), 2)
+    translates = bounds_array[..., 0]
+    scales = np.abs(bounds_array[..., 1] - translates)
+
+    _check_scale(scales.tolist())
+
+    return tuple(
+        STTransform(
+            order=output_order,
+            axes=axes,
+            units=array_units,
+            translate=tuple(translate),
+            scale=tuple(scale),
+        )
+        for array_units, translate, scale in zip(
+            units, translates.tolist(), scales.tolist()
+        )
+    )
+
+
 def stt_to_coords(
     transform: STTransform, shape: tuple[int, ...]
 ) -> tuple[DataArray, ...]:
@@ -163,14 +257,15 @@ def stt_to_coords(
         A tuple of DataArrays, one per axis.
 
     """
-    axes = transform.axes if transform.order == "C" else reversed(transform.axes)
+    # an F-ordered transform lists every parameter in reverse relative to `shape`
+    orderer = slice(None) if transform.order == "C" else slice(None, None, -1)
+    params = zip(
+        transform.axes[orderer],
+        transform.scale[orderer],
+        transform.translate[orderer],
+        transform.units[orderer],
+    )
     return tuple(
-        stt_coord(
-            shape[idx],
-            dim=k,
-            scale=transform.scale[idx],
-            translate=transform.translate[idx],
-            unit=transform.units[idx],
-        )
-        for idx, k in enumerate(axes)
+        stt_coord(length, dim=axis, scale=scale, translate=translate, unit=unit)
+        for length, (axis, scale, translate, unit) in zip(shape, params)
     )
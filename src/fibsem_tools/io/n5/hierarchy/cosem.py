@@ -15,7 +15,7 @@ from typing_extensions import deprecated
 from xarray import DataArray
 
 from fibsem_tools.chunk import normalize_chunks
-from fibsem_tools.coordinate import stt_from_array, stt_to_coords
+from fibsem_tools.coordinate import stt_from_array, stt_from_arrays, stt_to_coords
 
 
 class ScaleMetaV1(BaseModel):
@@ -55,10 +55,10 @@ class CosemGroupMetadataV1(BaseModel):
         Parameters
         ----------
 
-        arrays : Sequence[xarray.DataArray]
-            The collection of arrays from which to generate multiscale metadata. These
-            arrays are assumed to share the same `dims` attributes, albeit with varying
-            `coords`.
+        arrays : dict[str, xarray.DataArray]
+            The collection of arrays from which to generate multiscale metadata, keyed by
+            the path of each array in the multiscale collection. These arrays are
+            assumed to share the same `dims` attributes, albeit with varying `coords`.
         name : Optional[str]
             The name for the multiresolution collection
 
@@ -66,13 +66,16 @@ class CosemGroupMetadataV1(BaseModel):
         -------
         COSEMGroupMetadataV1
         """
+        transforms = stt_from_arrays(arrays.values())
 
+        # the paths are the keys of `arrays` and the transforms are validated
+        # STTransform instances, so the inner models are built without validation
         multiscales = [
-            MultiscaleMetaV1(
+            MultiscaleMetaV1.model_construct(
                 name=name,
                 datasets=[
-                    ScaleMetaV1(path=path, transform=stt_from_array(array=arr))
-                    for path, arr in arrays.items()
+                    ScaleMetaV1.model_construct(path=path, transform=tfm)
+                    for path, tfm in zip(arrays.keys(), transforms, strict=True)
                 ],
             )
         ]
@@ -99,14 +102,10 @@ class CosemGroupMetadataV2(BaseModel):
         Parameters
         ----------
 
-        arrays : Sequence[xarray.DataArray]
-            The collection of arrays from which to generate multiscale metadata. These
-            arrays are assumed to share the same `dims` attributes, albeit with varying
-            `coords`.
-        paths: Union[Sequence[str], Literal["auto"]] = "auto"
-            The names for each of the arrays in the multiscale
-            collection. If set to "auto", arrays will be named automatically according
-            to the scheme `s0` for the largest array, s1 for second largest, and so on.
+        arrays : dict[str, xarray.DataArray]
+            The collection of arrays from which to generate multiscale metadata, keyed by
+            the path of each array in the multiscale collection. These arrays are
+            assumed to share the same `dims` attributes, albeit with varying `coords`.
         name : Optional[str], default is None.
             The name for the multiresolution collection.
 
@@ -115,14 +114,14 @@ class CosemGroupMetadataV2(BaseModel):
         COSEMGroupMetadataV2
 
         """
-
+        paths = tuple(arrays.keys())
         multiscales = [
             MultiscaleMetaV2(
                 name=name,
-                datasets=tuple(arrays.keys()),
+                datasets=paths,
             )
         ]
-        return cls(name=name, multiscales=multiscales, paths=tuple(arrays.keys()))
+        return cls(name=name, multiscales=multiscales, paths=paths)
 
 
 @deprecated(
@@ -139,8 +138,12 @@ class CosemMultiscaleArray(ArraySpec):
     attributes: CosemArrayAttrs
 
     @classmethod
-    def from_xarray(cls, array: DataArray, **kwargs):
-        attrs = CosemArrayAttrs(transform=stt_from_array(array))
+    def from_xarray(
+        cls, array: DataArray, *, transform: STTransform | None = None, **kwargs
+    ):
+        if transform is None:
+            transform = stt_from_array(array)
+        attrs = CosemArrayAttrs(transform=transform)
         return cls.from_array(array, attributes=attrs, **kwargs)
 
 
@@ -174,10 +177,6 @@ class CosemMultiscaleGroupV1(GroupSpec):
             instance will inherit the chunks of the arrays. If the `data` attribute
             is not chunked, then each `ArraySpec` will have chunks equal to the shape of
             the source array.
-        paths: Union[Sequence[str], Literal["auto"]] = "auto"
-            The names for each of the arrays in the multiscale
-            collection. If set to "auto", arrays will be named automatically according
-            to the scheme `s0` for the largest array, s1 for second largest, and so on.
         name: Optional[str], default is None
             The name for the multiscale collection.
         **kwargs:
@@ -185,13 +184,18 @@ class CosemMultiscaleGroupV1(GroupSpec):
             constructor.
         """
 
-        _chunks = normalize_chunks(arrays, chunks)
-
+        _chunks = normalize_chunks(arrays.values(), chunks)
         attrs = CosemGroupMetadataV1.from_xarrays(arrays, name)
+        # share the transforms derived for the group metadata with the array metadata
+        transforms = [ds.transform for ds in attrs.multiscales[0].datasets]
 
         array_specs = {
-            key: CosemMultiscaleArray.from_xarray(arr, chunks=cnks, **kwargs)
-            for arr, cnks, key in zip(arrays.values(), arrays.keys(), _chunks)
+            key: CosemMultiscaleArray.from_xarray(
+                arr, chunks=cnks, transform=tfm, **kwargs
+            )
+            for (key, arr), cnks, tfm in zip(
+                arrays.items(), _chunks, transforms, strict=True
+            )
         }
 
         return cls(attributes=attrs, members=array_specs)
@@ -232,13 +236,17 @@ class CosemMultiscaleGroupV2(GroupSpec):
             constructor.
         """
 
-        _chunks = normalize_chunks(arrays, chunks)
-        paths = tuple(arrays.keys())
+        _chunks = normalize_chunks(arrays.values(), chunks)
+        transforms = stt_from_arrays(arrays.values())
         attrs = CosemGroupMetadataV2.from_xarrays(arrays, name)
 
         array_specs = {
-            key: CosemMultiscaleArray.from_xarray(arr, chunks=cnks, **kwargs)
-            for arr, cnks, key in zip(arrays.values(), _chunks, paths)
+            key: CosemMultiscaleArray.from_xarray(
+                arr, chunks=cnks, transform=tfm, **kwargs
+            )
+            for (key, arr), cnks, tfm in zip(
+                arrays.items(), _chunks, transforms, strict=True
+            )
         }
 
         return cls(attributes=attrs, members=array_specs)
@@ -269,7 +277,7 @@ def model_group(
     return Group.from_arrays(
         arrays=tuple(arrays.values()),
         paths=tuple(arrays.keys()),
-        transforms=tuple(stt_from_array(a) for a in arrays.values()),
+        transforms=stt_from_arrays(arrays.values()),
         chunks=chunks,
         **kwargs,
     )
@@ -15,7 +15,7 @@ from cellmap_schemas.multiscale.neuroglancer_n5 import Group
 from xarray import DataArray
 
 from fibsem_tools.chunk import normalize_chunks
-from fibsem_tools.coordinate import stt_coord, stt_from_array
+from fibsem_tools.coordinate import stt_coord, stt_from_arrays
 from fibsem_tools.io.zarr.core import access_parent
 
 N5_AXES_3D = ["x", "y", "z"]
@@ -43,7 +43,7 @@ def model_group(
     """
     _chunks = normalize_chunks(arrays.values(), chunks)
 
-    transforms = tuple(stt_from_array(array) for array in arrays.values())
+    transforms = stt_from_arrays(arrays.values())
     base_transform = transforms[0]
     nonzero_translate = any(v != 0 for v in base_transform.translate)
 
@@ -7,6 +7,8 @@ import numpy as np
 import pytest
 from xarray import DataArray
 
+from fibsem_tools.coordinate import stt_array
+
 
 @pytest.fixture
 def tmp_zarr(tmpdir) -> str:
@@ -20,18 +22,26 @@ def tmp_n5(tmpdir):
     return str(path)
 
 
-def create_coord(
-    shape: int,
-    dim: str,
-    units: str | None,
-    scale: float,
-    translate: float,
-):
-    return DataArray(
-        (np.arange(shape) * scale) + translate,
-        dims=(dim,),
-        attrs={"units": units},
-    )
+@pytest.fixture(scope="session")
+def uint8_volume() -> np.ndarray:
+    """
+    A pseudorandom (10, 10, 10) uint8 array generated from a fixed seed. The array is
+    shared by all tests, so it is read-only.
+    """
+    data = np.random.default_rng(0).integers(0, 256, size=(10, 10, 10), dtype=np.uint8)
+    data.flags.writeable = False
+    return data
+
+
+def coord_values(shape: int, scale: float, translate: float) -> np.ndarray:
+    """
+    Create the values of a coordinate variable: `np.arange(shape) * scale + translate`,
+    scaled and translated in place to avoid allocating temporary arrays.
+    """
+    values = np.arange(shape, dtype=np.result_type(int, scale, translate))
+    values *= scale
+    values += translate
+    return values
 
 
 def create_array(
@@ -47,13 +57,74 @@ def create_array(
     Create a `DataArray` with a shape and coordinates
     defined by the parameters axes, units, types, scale, translate.
     """
-    coords = []
-    for dim, unit, shp, scle, trns in zip(dims, units, shape, scale, translate):
-        coords.append(
-            create_coord(shape=shp, dim=dim, units=unit, scale=scle, translate=trns)
-        )
+    coords = {
+        dim: (dim, coord_values(shp, scle, trns), {"units": unit})
+        for dim, unit, shp, scle, trns in zip(dims, units, shape, scale, translate)
+    }
+
+    return DataArray(np.zeros(shape), coords=coords, dims=dims, **kwargs)
+
 
-    return DataArray(np.zeros(shape), coords=coords, **kwargs)
+def downsample_zeros(data: DataArray) -> DataArray:
+    """
+    Downsample an all-zero `DataArray` by a factor of 2 along each dimension. This produces
+    the same result as `data.coarsen({dim: 2 for dim in data.dims}, boundary="trim").mean()`,
+    but skips averaging the data, which is known to be zero.
+    """
+    shape = tuple(data.sizes[dim] // 2 for dim in data.dims)
+    coords = {}
+    for dim, length in zip(data.dims, shape):
+        coord = data.coords[dim]
+        values = coord.values[: 2 * length].reshape(-1, 2).mean(axis=1)
+        coords[dim] = (dim, values, coord.attrs)
+
+    return DataArray(
+        np.zeros(shape, dtype=data.dtype),
+        dims=data.dims,
+        coords=coords,
+        attrs=data.attrs,
+        name=data.name,
+    )
+
+
+def build_pyramid() -> dict[str, DataArray]:
+    """
+    Create a two-level multiscale pyramid of all-zero `DataArray`s named "data".
+    The "s1" array is built directly with the coordinates that
+    `data["s0"].coarsen({d: 2 for d in data["s0"].dims}).mean()` would produce.
+    """
+    dims = ("z", "y", "x")
+    units = ("nm", "m", "mm")
+    return {
+        "s0": stt_array(
+            np.zeros((10, 10, 10)),
+            dims=dims,
+            scales=(1, 2, 3),
+            translates=(0, 1, 2),
+            units=units,
+            name="data",
+        ),
+        "s1": stt_array(
+            np.zeros((5, 5, 5)),
+            dims=dims,
+            scales=(2, 4, 6),
+            translates=(0.5, 2, 3.5),
+            units=units,
+            name="data",
+        ),
+    }
+
+
+@pytest.fixture(scope="session")
+def stt_pyramid() -> dict[str, DataArray]:
+    """
+    The multiscale pyramid from `build_pyramid`, created once per test session.
+    The arrays are shared by all tests, so their data is read-only.
+    """
+    pyramid = build_pyramid()
+    for array in pyramid.values():
+        array.values.flags.writeable = False
+    return pyramid
 
 
 @dataclass
@@ -84,7 +155,6 @@ def pyramid(request) -> tuple[DataArray, DataArray, DataArray]:
         shape=shape, dims=dims, units=units, scale=scale, translate=translate
     )
 
-    coarsen_kwargs = {**{dim: 2 for dim in data.dims}, "boundary": "trim"}
-    multi = (data, data.coarsen(**coarsen_kwargs).mean())
-    multi += (multi[-1].coarsen(**coarsen_kwargs).mean(),)
+    multi = (data, downsample_zeros(data))
+    multi += (downsample_zeros(multi[-1]),)
     return multi
@@ -11,6 +11,10 @@ from zarr import N5FSStore
 
 from fibsem_tools.coordinate import stt_from_array, stt_to_coords
 from fibsem_tools.io.n5.core import create_dataarray
+from fibsem_tools.io.n5.hierarchy.cosem import (
+    CosemMultiscaleGroupV1,
+    CosemMultiscaleGroupV2,
+)
 from tests.conftest import PyramidRequest
 
 
@@ -42,6 +46,9 @@ def test_sttransform() -> None:
         translate=[10.0, 5.0, 0.0],
         scale=[10.0, 1.0, 1.0],
     )
+    assert all(
+        c.equals(t) for c, t in zip(coords, stt_to_coords(transform, data.shape))
+    )
 
 
 @pytest.mark.parametrize(
@@ -96,3 +103,40 @@ def test_read_array(
         )
         result = tuple(a.equals(b) for a, b in zip(observed, pyramid))
         assert result == (True, True, True)
+
+
+@pytest.mark.parametrize(
+    "pyramid",
+    [
+        PyramidRequest(
+            dims=("z", "y", "x"),
+            shape=(12, 13, 14),
+            scale=(1, 2, 3),
+            translate=(0, 0, 0),
+        ),
+    ],
+    indirect=["pyramid"],
+)
+@pytest.mark.parametrize("group_cls", [CosemMultiscaleGroupV1, CosemMultiscaleGroupV2])
+def test_multiscale_group(
+    pyramid: tuple[DataArray, DataArray, DataArray],
+    group_cls: type[CosemMultiscaleGroupV1] | type[CosemMultiscaleGroupV2],
+) -> None:
+    paths = ("s0", "s1", "s2")
+    arrays = dict(zip(paths, pyramid))
+    chunks = ((6, 6, 6), (4, 4, 4), (2, 2, 2))
+    with pytest.warns(DeprecationWarning):
+        group = group_cls.from_xarrays(arrays, chunks=chunks, name="foo")
+
+    assert tuple(group.members.keys()) == paths
+    assert tuple(m.chunks for m in group.members.values()) == chunks
+    for path, array in arrays.items():
+        assert group.members[path].attributes.transform == stt_from_array(array)
+
+    datasets = group.attributes.multiscales[0].datasets
+    if group_cls is CosemMultiscaleGroupV1:
+        assert tuple(d.path for d in datasets) == paths
+        for dataset in datasets:
+            assert dataset.transform == group.members[dataset.path].attributes.transform
+    else:
+        assert tuple(datasets) == paths
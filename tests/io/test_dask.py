@@ -97,5 +97,5 @@ def test_chunksafe_writes(chunks: tuple[int, ...]) -> None:
 def test_store_blocks(tmp_zarr) -> None:
     data = da.arange(256).reshape(16, 16).rechunk((4, 4))
     z = zarr.open(tmp_zarr, mode="w", shape=data.shape, chunks=data.chunksize)
-    dask.delayed(store_blocks(data, z)).compute()
+    dask.compute(*store_blocks(data, z), scheduler="synchronous")
     assert np.array_equal(read(tmp_zarr)[:], data.compute())
@@ -13,9 +13,9 @@ from fibsem_tools.io.h5 import access
 
 
 @pytest.mark.parametrize("key", ("s0", "s2"))
-def test_access_array(tmpdir: LEGACY_PATH, key: str) -> None:
+def test_access_array(tmpdir: LEGACY_PATH, uint8_volume: np.ndarray, key: str) -> None:
     path = os.path.join(str(tmpdir), "foo.h5")
-    data = np.random.randint(0, 255, size=(10, 10, 10), dtype="uint8")
+    data = uint8_volume
     attrs = {"resolution": "1000"}
 
     with h5py.File(path, mode="w") as h5f:
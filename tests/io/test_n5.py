@@ -15,29 +15,33 @@ import dask.array as da
 import numpy as np
 import pytest
 import zarr
+from numpy.testing import assert_array_equal
 
 from fibsem_tools.io.n5.core import access
 from fibsem_tools.io.n5.hierarchy import cosem, neuroglancer
 
+_RNG = np.random.default_rng(0)
+_GROUP_DATA = np.full(100, 42, dtype=np.uint8)
+
 
 def test_access_array(tmp_n5: str) -> None:
-    data = np.random.randint(0, 255, size=(100,), dtype="uint8")
+    data = _RNG.integers(0, 255, size=100, dtype=np.uint8)
     z = zarr.open(tmp_n5, mode="w", shape=data.shape, chunks=10)
     z[:] = data
-    assert np.array_equal(access(tmp_n5, "", mode="r")[:], data)
+    assert_array_equal(access(tmp_n5, "", mode="r")[:], data)
 
 
-def test_access_group(tmp_zarr: str) -> None:
-    data = np.zeros(100, dtype="uint8") + 42
+def test_access_group(tmp_n5: str) -> None:
+    data = _GROUP_DATA
     path = "foo"
-    zg = zarr.open(zarr.N5FSStore(tmp_zarr), mode="a")
+    zg = zarr.open(zarr.N5FSStore(tmp_n5), mode="a")
     zg[path] = data
     zg.attrs["bar"] = 10
-    assert access(tmp_zarr, "", mode="a") == zg
+    assert access(tmp_n5, "", mode="a") == zg
 
-    zg = access(tmp_zarr, "", mode="w", attrs={"bar": 10})
+    zg = access(tmp_n5, "", mode="w", attrs={"bar": 10})
     zg["foo"] = data
-    assert zarr.open(zarr.N5FSStore(tmp_zarr), mode="a") == zg
+    assert zarr.open(zarr.N5FSStore(tmp_n5), mode="a") == zg
 
 
 @pytest.mark.parametrize("chunks", ["auto", (10,)])
@@ -53,7 +57,7 @@ def test_dask(tmp_n5: str, chunks: Literal["auto"] | tuple[int, ...]) -> None:
 
     assert observed.chunks == expected.chunks
     assert observed.name == expected.name
-    assert np.array_equal(observed, data)
+    assert_array_equal(observed, data)
 
 
 @pytest.mark.parametrize("metadata_type", ["neuroglancer", "cosem"])
@@ -17,19 +17,20 @@ if TYPE_CHECKING:
     from pathlib import Path
     from typing import Any, Literal
 
-import itertools
-import os
+import re
+from pathlib import PurePosixPath
 
 import dask.array as da
 import numpy as np
 import pytest
 import zarr
 from datatree import DataTree
+from numpy.testing import assert_array_equal
 from xarray import DataArray
 from xarray.testing import assert_equal
 from zarr.storage import FSStore, NestedDirectoryStore
 
-from fibsem_tools.coordinate import stt_array, stt_from_array
+from fibsem_tools.coordinate import stt_from_arrays
 from fibsem_tools.io.core import (
     model_multiscale_group,
     read_dask,
@@ -41,30 +42,24 @@ from fibsem_tools.io.zarr.core import (
 from fibsem_tools.io.zarr.hierarchy import ome_ngff
 from tests.conftest import PyramidRequest
 
+_RNG = np.random.default_rng(0)
+_GROUP_DATA = np.full(100, 42, dtype=np.uint8)
+_NO_ZARR_RE = re.compile("None of the parts of the url")
+_TOO_MUCH_ZARR_RE = re.compile("Too many parts of the url")
+
 
 def test_url(tmp_zarr: str) -> None:
     store = FSStore(tmp_zarr)
     group = zarr.group(store)
     arr = group.create_dataset(name="foo", data=np.arange(10))
-    assert get_url(arr) == f"file://{store.path}/foo"
+    assert get_url(arr) == f"file://{PurePosixPath(store.path) / 'foo'}"
 
 
-def test_read_xarray(tmp_zarr: str) -> None:
+def test_read_xarray(tmp_zarr: str, stt_pyramid: dict[str, DataArray]) -> None:
     path = "test"
-    url = os.path.join(tmp_zarr, path)
+    url = str(PurePosixPath(tmp_zarr) / path)
 
-    data = {
-        "s0": stt_array(
-            np.zeros((10, 10, 10)),
-            dims=("z", "y", "x"),
-            scales=(1, 2, 3),
-            translates=(0, 1, 2),
-            units=("nm", "m", "mm"),
-            name="data",
-        )
-    }
-    data["s1"] = data["s0"].coarsen({d: 2 for d in data["s0"].dims}).mean()
-    data["s1"].name = "data"
+    data = stt_pyramid
 
     g_spec = model_multiscale_group(
         arrays=data,
@@ -73,9 +68,12 @@ def test_read_xarray(tmp_zarr: str) -> None:
     )
     zgroup = g_spec.to_zarr(zarr.NestedDirectoryStore(tmp_zarr), path=path)
 
+    transforms = {
+        key: tfm.model_dump() for key, tfm in zip(data, stt_from_arrays(data.values()))
+    }
     for key, value in data.items():
         zgroup[key] = value.data
-        zgroup[key].attrs["transform"] = stt_from_array(value).model_dump()
+        zgroup[key].attrs["transform"] = transforms[key]
 
     tree_expected = DataTree.from_dict(data, name=path)
     assert_equal(to_xarray(zgroup["s0"]), data["s0"])
@@ -84,37 +82,32 @@ def test_read_xarray(tmp_zarr: str) -> None:
     assert tree_expected.equals(read_xarray(url))
 
 
-@pytest.mark.parametrize("attrs", [None, {"foo": 10}])
-@pytest.mark.parametrize("coords", ["auto"])
-@pytest.mark.parametrize("use_dask", [True, False])
-@pytest.mark.parametrize("name", [None, "foo"])
-@pytest.mark.parametrize("path", ["a", "a/b"])
-def test_read_datatree(
-    tmp_zarr: str,
-    attrs: dict[str, Any] | None,
-    coords: str,
-    use_dask: bool,
-    name: str | None,
-    path: str,
-) -> None:
-    base_data = np.zeros((10, 10, 10))
-    store = zarr.NestedDirectoryStore(tmp_zarr)
-    _attrs = {} if attrs is None else attrs
-
-    name_expected = path.split("/")[-1] if name is None else name
-
-    data = {
-        "s0": stt_array(
-            base_data,
-            dims=("z", "y", "x"),
-            scales=(1, 2, 3),
-            translates=(0, 1, 2),
-            units=("nm", "m", "mm"),
-            name="data",
-        )
-    }
-    data["s1"] = data["s0"].coarsen({d: 2 for d in data["s0"].dims}).mean()
-    data["s1"].name = "data"
+@pytest.fixture(
+    scope="module",
+    params=[
+        ("memory", "a"),
+        ("memory", "a/b"),
+        pytest.param(("disk", "a"), marks=pytest.mark.slow),
+        pytest.param(("disk", "a/b"), marks=pytest.mark.slow),
+    ],
+    ids=lambda param: "-".join(param),
+)
+def datatree_group(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    stt_pyramid: dict[str, DataArray],
+) -> zarr.Group:
+    """
+    A multiscale group that contains the arrays from `stt_pyramid`. `request.param` is
+    a tuple of the kind of store, either "memory" or "disk", and the path to the group
+    in that store. The group is built once per parameter and shared across tests.
+    """
+    store_kind, path = request.param
+    if store_kind == "memory":
+        store = zarr.MemoryStore()
+    else:
+        store = NestedDirectoryStore(str(tmp_path_factory.mktemp("datatree")))
+    data = stt_pyramid
 
     g_spec = model_multiscale_group(
         arrays=data,
@@ -122,43 +115,54 @@ def test_read_datatree(
         metadata_type="ome-ngff",
     )
     group = g_spec.to_zarr(store, path=path)
-    group.attrs.update(**_attrs)
 
     for key, value in data.items():
         group[key] = value.data
-        # group[key].attrs["transform"] = STTransform.from_xarray(value).model_dump()
+    # a read-only handle guards the shared group against modification
+    return access(store, path, mode="r")
+
+
+@pytest.mark.parametrize("coords", ["auto"])
+@pytest.mark.parametrize("use_dask", [True, False])
+@pytest.mark.parametrize("name", [None, "foo"])
+def test_read_datatree_structure(
+    datatree_group: zarr.Group,
+    stt_pyramid: dict[str, DataArray],
+    coords: str,
+    use_dask: bool,
+    name: str | None,
+) -> None:
+    group = datatree_group
+    store = group.store
+    path = group.path
+
+    name_expected = path.split("/")[-1] if name is None else name
+
+    data = stt_pyramid
 
     data_store = create_datatree(
-        access(tmp_zarr, path, mode="r"),
+        access(store, path, mode="r"),
         use_dask=use_dask,
         name=name,
         coords=coords,
-        attrs=attrs,
     )
 
-    if name is None:
-        assert data_store.name == group.basename
-    else:
-        assert data_store.name == name
-
+    assert data_store.name == name_expected
     assert (
         all(isinstance(d["data"].data, da.Array) for k, d in data_store.items())
         == use_dask
     )
+    assert set(data_store.keys()) == set(data.keys())
+    for k in data:
+        assert_equal(data_store[k]["data"], data[k])
 
-    # create a datatree directly
-    tree_dict = {
-        k: DataArray(
-            access(tmp_zarr, os.path.join(path, k), mode="r"),
-            coords=data[k].coords,
-            name="data",
-        )
-        for k in data
-    }
-
-    tree_expected = DataTree.from_dict(tree_dict, name=name_expected)
 
-    assert tree_expected.equals(data_store)
+@pytest.mark.parametrize("attrs", [None, {"foo": 10}])
+def test_read_datatree_attrs_roundtrip(
+    datatree_group: zarr.Group, attrs: dict[str, Any] | None
+) -> None:
+    group = datatree_group
+    data_store = create_datatree(group, use_dask=False, attrs=attrs)
 
     if attrs is None:
         assert dict(data_store.attrs) == dict(group.attrs)
@@ -226,15 +230,15 @@ def test_read_dataarray(
 
 
 def test_access_array(tmp_zarr: str) -> None:
-    data = np.random.randint(0, 255, size=(100,), dtype="uint8")
+    data = _RNG.integers(0, 255, size=100, dtype=np.uint8)
     z = zarr.open(tmp_zarr, mode="w", shape=data.shape, chunks=10)
     z[:] = data
-    assert np.array_equal(access(tmp_zarr, "", mode="r")[:], data)
+    assert_array_equal(access(tmp_zarr, "", mode="r")[:], data)
 
 
 def test_access_group(tmp_zarr: str) -> None:
     default_store = DEFAULT_ZARR_STORE
-    data = np.zeros(100, dtype="uint8") + 42
+    data = _GROUP_DATA
     path = "foo"
     zg = zarr.open(default_store(tmp_zarr), mode="a")
     zg[path] = data
@@ -259,9 +263,9 @@ def test_dask(tmp_zarr: str, chunks: Literal["auto"] | tuple[int, ...]) -> None:
 
     assert observed.chunks == expected.chunks
     assert observed.name == expected.name
-    assert np.array_equal(observed, data)
+    assert_array_equal(observed, data)
 
-    assert np.array_equal(read_dask(get_url(zarray), chunks=chunks).compute(), data)
+    assert_array_equal(read_dask(get_url(zarray), chunks=chunks).compute(), data)
 
 
 @pytest.mark.parametrize(
@@ -280,12 +284,26 @@ def test_chunk_keys(
     )
 
     dim_sep = arr._dimension_separator
-    chunk_idcs = itertools.product(*(range(c_s) for c_s in arr.cdata_shape))
-    expected = tuple(
-        os.path.join(arr.path, dim_sep.join(map(str, idx))) for idx in chunk_idcs
+    # the index of every chunk, in C order, as rows of strings
+    chunk_idcs = np.indices(arr.cdata_shape).reshape(len(shape), -1).T.astype(str)
+    prefix = f"{arr.path}/" if arr.path else ""
+    expected = tuple(prefix + dim_sep.join(idx) for idx in chunk_idcs)
+    observed = list(chunk_keys(arr))
+    assert len(observed) == len(expected)
+    assert set(observed) == set(expected)
+
+
+def test_chunk_keys_order() -> None:
+    arr = zarr.create(
+        shape=(4, 6),
+        store=zarr.MemoryStore(),
+        path="test",
+        chunks=(2, 2),
+        dtype="uint8",
     )
-    observed = tuple(chunk_keys(arr))
-    assert observed == expected
+    # chunk keys are generated in C order
+    expected = ["test/0.0", "test/0.1", "test/0.2", "test/1.0", "test/1.1", "test/1.2"]
+    assert list(chunk_keys(arr)) == expected
 
 
 @pytest.mark.parametrize("inline_array", [True, False])
@@ -311,11 +329,11 @@ def test_parse_url(url: str, expected: str):
 
 @pytest.mark.parametrize("url", ["foo", "foo/bar/baz", "foo/bar/b.zarraz"])
 def test_parse_url_no_zarr(url: str):
-    with pytest.raises(ValueError, match="None of the parts of the url"):
+    with pytest.raises(ValueError, match=_NO_ZARR_RE):
         parse_url(url)
 
 
 @pytest.mark.parametrize("url", ["foo.zarr/baz.zarr", "foo.zarr/bar/baz.zarr"])
 def test_parse_url_too_much_zarr(url: str):
-    with pytest.raises(ValueError, match="Too many parts of the url"):
+    with pytest.raises(ValueError, match=_TOO_MUCH_ZARR_RE):
         parse_url(url)
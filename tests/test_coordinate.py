@@ -1,7 +1,14 @@
 import numpy as np
 import pytest
+from pydantic import ValidationError
 
-from fibsem_tools.coordinate import flip, stt_array, stt_coord
+from fibsem_tools.coordinate import (
+    flip,
+    stt_array,
+    stt_coord,
+    stt_from_array,
+    stt_from_arrays,
+)
 
 
 @pytest.mark.parametrize("length", [1, 10, 100])
@@ -64,3 +71,57 @@ def test_flip(flip_dims):
             test_selector += (slice(None),)
 
     assert np.array_equal(flip(data, flip_dims).data, data.data[test_selector])
+
+
+@pytest.mark.parametrize("reverse_axes", [True, False])
+def test_stt_from_arrays(reverse_axes: bool):
+    dims = ("a", "b", "c")
+    arrays = tuple(
+        stt_array(
+            np.zeros((10 // factor, 11 // factor, 12 // factor)),
+            dims=dims,
+            scales=(factor, 2 * factor, 0.5 * factor),
+            translates=(factor, -1, 3.5),
+            units=("nm", "m", "mm"),
+        )
+        for factor in (1, 2, 4)
+    )
+    observed = stt_from_arrays(arrays, reverse_axes=reverse_axes)
+    expected = tuple(stt_from_array(a, reverse_axes=reverse_axes) for a in arrays)
+    assert observed == expected
+    assert stt_from_arrays(()) == ()
+
+
+def test_stt_from_arrays_mismatched_dims():
+    arrays = (
+        stt_array(
+            np.zeros((3, 3)),
+            dims=("a", "b"),
+            scales=(1, 1),
+            translates=(0, 0),
+            units=("nm", "nm"),
+        ),
+        stt_array(
+            np.zeros((3, 3)),
+            dims=("b", "a"),
+            scales=(1, 1),
+            translates=(0, 0),
+            units=("nm", "nm"),
+        ),
+    )
+    with pytest.raises(ValueError, match="All arrays must have the same dimensions"):
+        stt_from_arrays(arrays)
+
+
+def test_stt_from_arrays_invalid_units():
+    array = stt_array(
+        np.zeros((3, 3)),
+        dims=("a", "b"),
+        scales=(1, 1),
+        translates=(0, 0),
+        units=("nm", 5),
+    )
+    with pytest.raises(ValidationError):
+        stt_from_array(array)
+    with pytest.raises(ValidationError):
+        stt_from_arrays((array,))